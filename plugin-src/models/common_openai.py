@@ -1,7 +1,9 @@
 from collections.abc import Mapping
+from functools import lru_cache
 
 import openai
 from httpx import Timeout
+from openai import OpenAI
 
 from dify_plugin.errors.model import (
     InvokeAuthorizationError,
@@ -13,29 +15,43 @@ from dify_plugin.errors.model import (
 )
 
 
+@lru_cache(maxsize=32)
+def _get_client(api_key: str, base_url: str) -> OpenAI:
+    # Memoize clients so the httpx connection pool (and its keep-alive TLS
+    # sessions) is reused across invocations instead of rebuilt per call.
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=Timeout(315.0, read=300.0, write=10.0, connect=5.0),
+        max_retries=1,
+    )
+
+
 class _CommonOpenAI:
-    def _to_credential_kwargs(self, credentials: Mapping) -> dict:
+    def _client(self, credentials: Mapping) -> OpenAI:
         # Use API Base exactly as provided (no automatic /v1 suffix).
         api_base = str(credentials["codex_api_base"]).rstrip("/")
+        return _get_client(str(credentials["codex_api_key"]), api_base)
 
-        return {
-            "api_key": credentials["codex_api_key"],
-            "base_url": api_base,
-            "timeout": Timeout(315.0, read=300.0, write=10.0, connect=5.0),
-            "max_retries": 1,
-        }
-
-    @property
-    def _invoke_error_mapping(self) -> dict[type[InvokeError], list[type[Exception]]]:
-        return {
-            InvokeConnectionError: [openai.APIConnectionError, openai.APITimeoutError],
-            InvokeServerUnavailableError: [openai.InternalServerError],
-            InvokeRateLimitError: [openai.RateLimitError],
-            InvokeAuthorizationError: [openai.AuthenticationError, openai.PermissionDeniedError],
-            InvokeBadRequestError: [
+    # Precomputed once at import time so the per-call error mapping avoids
+    # rebuilding a dict of lists (and re-tupling them) on every SDK call.
+    _ERROR_TABLE: tuple[tuple[type[InvokeError], tuple[type[Exception], ...]], ...] = (
+        (InvokeConnectionError, (openai.APIConnectionError, openai.APITimeoutError)),
+        (InvokeServerUnavailableError, (openai.InternalServerError,)),
+        (InvokeRateLimitError, (openai.RateLimitError,)),
+        (InvokeAuthorizationError, (openai.AuthenticationError, openai.PermissionDeniedError)),
+        (
+            InvokeBadRequestError,
+            (
                 openai.BadRequestError,
                 openai.NotFoundError,
                 openai.UnprocessableEntityError,
                 openai.APIError,
-            ],
-        }
+            ),
+        ),
+    )
+
+    @property
+    def _invoke_error_mapping(self) -> dict[type[InvokeError], list[type[Exception]]]:
+        # Kept for the dify_plugin base-class interface; derived from the table.
+        return {mapped: list(excs) for mapped, excs in self._ERROR_TABLE}
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import re
+import time
 from collections.abc import Generator, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Any, Optional, Union, cast
 
+import orjson
 import tiktoken
-from openai import OpenAI, Stream
+from openai import NotFoundError, Stream
 from openai.types.responses import Response, ResponseStreamEvent
 
 from dify_plugin import LargeLanguageModel
@@ -36,18 +39,119 @@ from dify_plugin.errors.model import (
 from ..common_openai import _CommonOpenAI
 
 
+def _dumps(obj: Any) -> str:
+    # orjson serializes in C, typically 3-5x faster than stdlib json for the
+    # tool schemas and arguments dumped on every request.
+    return orjson.dumps(obj).decode("utf-8")
+
+
+# O(1) membership check for response content types carrying text.
+_TEXT_CONTENT_TYPES = frozenset({"output_text", "text", "input_text"})
+
+_TIER_NAMES = ("medium", "high", "xhigh", "extra-high")
+_SINGLE_TIER_SUFFIXES = tuple(f"-{tier}" for tier in _TIER_NAMES)
+# Longest-first so "-extra-high" and two-part "<tier>-<tier>" forms strip
+# before a plain "-high". An endswith over this tuple runs in C and beats the
+# regex engine for these short, fixed suffixes.
+_TIER_SUFFIXES = tuple(
+    sorted(
+        {f"-{first}-{second}" for first in _TIER_NAMES for second in _TIER_NAMES}
+        | set(_SINGLE_TIER_SUFFIXES),
+        key=len,
+        reverse=True,
+    )
+)
+
+
+@dataclass
+class _StreamState:
+    """Mutable state threaded through the per-event stream handlers."""
+
+    model: str
+    prompt_messages: list[PromptMessage]
+    # Accumulated as a list of fragments; joined once at end of stream to
+    # avoid O(n^2) repeated str concatenation on long generations.
+    text_parts: list[str] = field(default_factory=list)
+    index: int = 0
+    tool_calls: list[AssistantPromptMessage.ToolCall] = field(default_factory=list)
+    # call_id -> {"name": str, "arguments_parts": list[str]}; argument deltas
+    # are buffered as fragments and joined once, like text_parts above.
+    pending_tool_calls: dict[str, dict[str, Any]] = field(default_factory=dict)
+    current_tool_call: Optional[str] = None
+    final_response: Optional[Response] = None
+    pending_delta: str = ""
+    pending_item_id: str = ""
+    last_flush_ns: int = 0
+
+
+# Tool schemas are typically reused across every request in a chat session;
+# cache their serialized JSON keyed by object identity so json.dumps runs once
+# per schema. The cached object is kept alongside the string so a recycled id
+# can never return stale output.
+_TOOL_JSON_CACHE: dict[int, tuple[Any, str]] = {}
+_TOOL_JSON_CACHE_MAX = 256
+
+
+def _tool_parameters_json(parameters: Any) -> str:
+    key = id(parameters)
+    cached = _TOOL_JSON_CACHE.get(key)
+    if cached is not None and cached[0] is parameters:
+        return cached[1]
+
+    dumped = _dumps(parameters)
+    if len(_TOOL_JSON_CACHE) >= _TOOL_JSON_CACHE_MAX:
+        _TOOL_JSON_CACHE.pop(next(iter(_TOOL_JSON_CACHE)))
+    _TOOL_JSON_CACHE[key] = (parameters, dumped)
+    return dumped
+
+
+# String tool schemas are re-sent verbatim on every request in a session;
+# cache the parsed dict keyed by the raw string (bounded FIFO, like the
+# serialization cache above) so json parsing runs once per schema.
+_PARSED_SCHEMA_CACHE: dict[str, dict] = {}
+_PARSED_SCHEMA_CACHE_MAX = 256
+
+
+def _parse_tool_parameters(parameters: str) -> dict:
+    cached = _PARSED_SCHEMA_CACHE.get(parameters)
+    if cached is not None:
+        return cached
+
+    try:
+        parsed = orjson.loads(parameters)
+    except orjson.JSONDecodeError:
+        parsed = {"type": "object", "properties": {}}
+    if not isinstance(parsed, dict):
+        parsed = {"type": "object", "properties": {}}
+
+    if len(_PARSED_SCHEMA_CACHE) >= _PARSED_SCHEMA_CACHE_MAX:
+        _PARSED_SCHEMA_CACHE.pop(next(iter(_PARSED_SCHEMA_CACHE)))
+    _PARSED_SCHEMA_CACHE[parameters] = parsed
+    return parsed
+
+
+@lru_cache(maxsize=64)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    # Encoder construction parses the full mergeable-ranks vocabulary and is
+    # expensive; cache per model name so repeated token counts pay it once.
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
-    _KNOWN_PERFORMANCE_TIERS = {"medium", "high", "xhigh", "extra-high"}
+    _KNOWN_PERFORMANCE_TIERS = frozenset(_TIER_NAMES)
     _KNOWN_VERBOSITY_LEVELS = {"low", "medium", "high"}
-    _TIER_SUFFIX_PATTERN = re.compile(
-        r"-(?:medium|high|xhigh|extra-high)(?:-(?:medium|high|xhigh|extra-high))?$",
-        re.IGNORECASE,
-    )
-    _MODEL_HAS_TIER_PATTERN = re.compile(
-        r"-(?:medium|high|xhigh|extra-high)$", re.IGNORECASE
-    )
     _TIER_VALUE_PATTERN = re.compile(r"^[a-z0-9][a-z0-9._-]{0,31}$")
 
+    # Coalesce streamed text deltas into micro-batches: flush once the pending
+    # text reaches this many characters or this much time has elapsed. Fast
+    # models emit thousands of per-token events per second; batching them keeps
+    # the UX smooth while avoiding a chunk allocation per token.
+    _STREAM_FLUSH_MIN_CHARS = 32
+    _STREAM_FLUSH_INTERVAL_NS = 20_000_000
+
     def _invoke(
         self,
         model: str,
@@ -76,7 +180,7 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
             user=user,
         )
 
-        client = OpenAI(**self._to_credential_kwargs(credentials))
+        client = self._client(credentials)
         response = self._with_invoke_error_mapping(
             lambda: client.responses.create(
                 model=model,
@@ -103,8 +207,21 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         )
 
     def validate_credentials(self, model: str, credentials: dict) -> None:
+        client = self._client(credentials)
+
+        try:
+            # Cheap metadata call: checks auth without provisioning an
+            # inference worker or spending tokens.
+            client.models.list()
+            return
+        except NotFoundError:
+            # Some responses-only gateways don't implement /models; fall back
+            # to a minimal generation probe.
+            pass
+        except Exception as ex:
+            raise CredentialsValidateFailedError(str(ex))
+
         try:
-            client = OpenAI(**self._to_credential_kwargs(credentials))
             client.responses.create(
                 model=model,
                 input="ping",
@@ -117,30 +234,25 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
     def get_customizable_model_schema(
         self, model: str, credentials: dict
     ) -> AIModelEntity:
-        template = self._pick_template_model()
-        return self._build_model_entity_from_template(model, template)
+        return self._build_model_entity_from_template(model)
 
     def remote_models(self, credentials: dict) -> list[AIModelEntity]:
         """
         Auto-discover remote model ids from the provider /models endpoint.
         Dify can surface these discovered models in the model list.
         """
-        template = self._pick_template_model()
-        client = OpenAI(**self._to_credential_kwargs(credentials))
+        client = self._client(credentials)
 
         listed_models = self._with_invoke_error_mapping(lambda: client.models.list())
         remote_items = getattr(listed_models, "data", listed_models) or []
 
-        entities: list[AIModelEntity] = []
-        seen: set[str] = set()
-        for item in remote_items:
-            model_id = getattr(item, "id", "")
-            if not model_id or model_id in seen:
-                continue
-            seen.add(model_id)
-            entities.append(self._build_model_entity_from_template(model_id, template))
-
-        return entities
+        # dict.fromkeys dedups in C while preserving the gateway's ordering.
+        model_ids = dict.fromkeys(getattr(item, "id", "") for item in remote_items)
+        return [
+            self._build_model_entity_from_template(model_id)
+            for model_id in model_ids
+            if model_id
+        ]
 
     def get_num_tokens(
         self,
@@ -149,26 +261,29 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         prompt_messages: list[PromptMessage],
         tools: Optional[list[PromptMessageTool]] = None,
     ) -> int:
+        if not prompt_messages and not tools:
+            return 0
+
         text = "\n".join(
             part for message in prompt_messages for part in [self._extract_text(message)] if part
         )
-        if not text:
+        if not text and not tools:
             return 0
 
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except Exception:
-            encoding = tiktoken.get_encoding("cl100k_base")
-
-        token_count = len(encoding.encode(text))
+        encoding = _get_encoding(model)
 
+        # Tokenize everything in one batched call: encode_ordinary_batch
+        # releases the GIL and runs in parallel inside the Rust extension,
+        # instead of paying FFI overhead per tool field.
+        parts = [text]
         if tools:
             for tool in tools:
-                token_count += len(encoding.encode(tool.name or ""))
-                token_count += len(encoding.encode(tool.description or ""))
-                token_count += len(encoding.encode(json.dumps(tool.parameters or {})))
+                parts.append(tool.name or "")
+                parts.append(tool.description or "")
+                parameters = tool.parameters
+                parts.append(_tool_parameters_json(parameters) if parameters else "{}")
 
-        return token_count
+        return sum(len(encoded) for encoded in encoding.encode_ordinary_batch(parts, num_threads=4))
 
     def _build_responses_payload(
         self,
@@ -211,7 +326,10 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
 
         return payload
 
-    def _pick_template_model(self) -> AIModelEntity:
+    @cached_property
+    def _template_model(self) -> AIModelEntity:
+        # predefined_models() re-reads and parses the YAML schemas; cache the
+        # chosen template for the lifetime of this model instance.
         predefined_models = self.predefined_models()
         if not predefined_models:
             raise ValueError("No predefined model schema found")
@@ -220,20 +338,26 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
             predefined_models[0],
         )
 
-    def _build_model_entity_from_template(
-        self,
-        model_id: str,
-        template: AIModelEntity,
-    ) -> AIModelEntity:
-        features = list(template.features or [])
+    @cached_property
+    def _template_snapshot(self) -> tuple[list, dict, list]:
+        # Shared, effectively immutable copies of the template's collections so
+        # per-id entity construction doesn't re-copy them N times.
+        template = self._template_model
         model_properties = template.model_properties or {}
         if hasattr(model_properties, "items"):
             model_properties = dict(model_properties.items())
         else:
             model_properties = dict(model_properties)
-        parameter_rules = list(template.parameter_rules or [])
+        return (
+            list(template.features or []),
+            model_properties,
+            list(template.parameter_rules or []),
+        )
 
-        return AIModelEntity(
+    def _build_model_entity_from_template(self, model_id: str) -> AIModelEntity:
+        features, model_properties, parameter_rules = self._template_snapshot
+
+        return AIModelEntity.model_construct(
             model=model_id,
             label=I18nObject(en_US=model_id, zh_Hans=model_id),
             model_type=ModelType.LLM,
@@ -241,7 +365,7 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
             fetch_from=FetchFrom.CUSTOMIZABLE_MODEL,
             model_properties=model_properties,
             parameter_rules=parameter_rules,
-            pricing=template.pricing,
+            pricing=self._template_model.pricing,
         )
 
     def _resolve_model_with_performance_tier(
@@ -256,9 +380,11 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         else:
             tier = self._normalize_performance_tier(tier_value or "auto")
 
+        model_lower = model.lower()
+
         # If the model id already contains a tier suffix (for example
         # gpt-5.3-codex-xhigh), preserve it unless a custom override is provided.
-        if self._MODEL_HAS_TIER_PATTERN.search(model) and not custom_tier:
+        if model_lower.endswith(_SINGLE_TIER_SUFFIXES) and not custom_tier:
             return model
 
         if tier in {"", "auto"}:
@@ -266,7 +392,11 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         if not self._TIER_VALUE_PATTERN.fullmatch(tier):
             return model
 
-        base_model = self._TIER_SUFFIX_PATTERN.sub("", model)
+        base_model = model
+        for suffix in _TIER_SUFFIXES:
+            if model_lower.endswith(suffix):
+                base_model = model[: -len(suffix)]
+                break
         return f"{base_model}-{tier}"
 
     def _normalize_performance_tier(self, tier_value: Any) -> str:
@@ -298,79 +428,117 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
     ) -> list[dict[str, Any]]:
         input_messages: list[dict[str, Any]] = []
 
+        converters = self._MESSAGE_CONVERTERS
+        fallback = converters[None]
         for message in prompt_messages:
-            if isinstance(message, SystemPromptMessage):
-                content = self._extract_text(message)
-                if content:
-                    input_messages.append({"role": "developer", "content": content})
-                continue
+            converter = converters.get(type(message)) or fallback
+            converter(self, message, input_messages)
 
-            if isinstance(message, UserPromptMessage):
-                if isinstance(message.content, str):
-                    input_messages.append({"role": "user", "content": message.content})
-                else:
-                    content_parts: list[dict[str, Any]] = []
-                    for item in message.content or []:
-                        if isinstance(item, TextPromptMessageContent):
-                            content_parts.append(
-                                {
-                                    "type": "input_text",
-                                    "text": item.data,
-                                }
-                            )
-                        elif isinstance(item, ImagePromptMessageContent):
-                            image_url = item.url if item.url else item.data
-                            image_part: dict[str, Any] = {
-                                "type": "input_image",
-                                "image_url": image_url,
-                            }
-                            if item.detail:
-                                image_part["detail"] = item.detail.value
-                            content_parts.append(image_part)
-                    if content_parts:
-                        input_messages.append({"role": "user", "content": content_parts})
-                continue
+        return input_messages
 
-            if isinstance(message, AssistantPromptMessage):
-                assistant_text = self._extract_text(message)
-                if assistant_text:
-                    input_messages.append({"role": "assistant", "content": assistant_text})
-
-                for tool_call in message.tool_calls or []:
-                    input_messages.append(
-                        {
-                            "type": "function_call",
-                            "call_id": tool_call.id or tool_call.function.name,
-                            "name": tool_call.function.name,
-                            "arguments": tool_call.function.arguments or "{}",
-                        }
-                    )
-                continue
+    def _convert_system_message(
+        self, message: PromptMessage, input_messages: list[dict[str, Any]]
+    ) -> None:
+        # Inline the common str-content case; _extract_text only runs for
+        # structured content.
+        content = (
+            message.content
+            if isinstance(message.content, str)
+            else self._extract_text(message)
+        )
+        if content:
+            input_messages.append({"role": "developer", "content": content})
 
-            if isinstance(message, ToolPromptMessage):
-                tool_output = self._extract_text(message)
-                input_messages.append(
+    def _convert_user_message(
+        self, message: PromptMessage, input_messages: list[dict[str, Any]]
+    ) -> None:
+        if isinstance(message.content, str):
+            input_messages.append({"role": "user", "content": message.content})
+            return
+
+        content_parts: list[dict[str, Any]] = []
+        for item in message.content or []:
+            if isinstance(item, TextPromptMessageContent):
+                content_parts.append(
                     {
-                        "type": "function_call_output",
-                        "call_id": message.tool_call_id,
-                        "output": tool_output or "",
+                        "type": "input_text",
+                        "text": item.data,
                     }
                 )
-                continue
+            elif isinstance(item, ImagePromptMessageContent):
+                image_url = item.url if item.url else item.data
+                image_part: dict[str, Any] = {
+                    "type": "input_image",
+                    "image_url": image_url,
+                }
+                if item.detail:
+                    image_part["detail"] = item.detail.value
+                content_parts.append(image_part)
+        if content_parts:
+            input_messages.append({"role": "user", "content": content_parts})
+
+    def _convert_assistant_message(
+        self, message: AssistantPromptMessage, input_messages: list[dict[str, Any]]
+    ) -> None:
+        assistant_text = (
+            message.content
+            if isinstance(message.content, str)
+            else self._extract_text(message)
+        )
+        if assistant_text:
+            input_messages.append({"role": "assistant", "content": assistant_text})
+
+        for tool_call in message.tool_calls or []:
+            input_messages.append(
+                {
+                    "type": "function_call",
+                    "call_id": tool_call.id or tool_call.function.name,
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments or "{}",
+                }
+            )
 
-            text = self._extract_text(message)
-            if text:
-                input_messages.append({"role": "user", "content": text})
+    def _convert_tool_message(
+        self, message: ToolPromptMessage, input_messages: list[dict[str, Any]]
+    ) -> None:
+        tool_output = (
+            message.content
+            if isinstance(message.content, str)
+            else self._extract_text(message)
+        )
+        input_messages.append(
+            {
+                "type": "function_call_output",
+                "call_id": message.tool_call_id,
+                "output": tool_output or "",
+            }
+        )
 
-        return input_messages
+    def _convert_generic_message(
+        self, message: PromptMessage, input_messages: list[dict[str, Any]]
+    ) -> None:
+        text = (
+            message.content
+            if isinstance(message.content, str)
+            else self._extract_text(message)
+        )
+        if text:
+            input_messages.append({"role": "user", "content": text})
+
+    # One type lookup per message instead of an isinstance chain; the None key
+    # holds the fallback for unknown message classes.
+    _MESSAGE_CONVERTERS = {
+        SystemPromptMessage: _convert_system_message,
+        UserPromptMessage: _convert_user_message,
+        AssistantPromptMessage: _convert_assistant_message,
+        ToolPromptMessage: _convert_tool_message,
+        None: _convert_generic_message,
+    }
 
     def _convert_tool_to_response_tool(self, tool: PromptMessageTool) -> dict[str, Any]:
         parameters: Any = tool.parameters
         if isinstance(parameters, str):
-            try:
-                parameters = json.loads(parameters)
-            except json.JSONDecodeError:
-                parameters = {"type": "object", "properties": {}}
+            parameters = _parse_tool_parameters(parameters)
         elif not isinstance(parameters, dict):
             parameters = {"type": "object", "properties": {}}
 
@@ -422,125 +590,180 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         prompt_messages: list[PromptMessage],
         tools: Optional[list[PromptMessageTool]] = None,
     ) -> Generator[LLMResultChunk, None, None]:
-        full_text = ""
-        index = 0
-        tool_calls: list[AssistantPromptMessage.ToolCall] = []
-
-        pending_tool_calls: dict[str, dict[str, str]] = {}
-        current_tool_call: Optional[str] = None
-        final_response: Optional[Response] = None
+        state = _StreamState(
+            model=model,
+            prompt_messages=prompt_messages,
+            last_flush_ns=time.monotonic_ns(),
+        )
 
+        handlers = self._STREAM_HANDLERS
         for event in response:
-            event_type = getattr(event, "type", "")
-
-            if event_type == "response.output_text.delta":
-                delta_text = getattr(event, "delta", "")
-                if not delta_text:
-                    continue
-
-                full_text += delta_text
-                yield LLMResultChunk(
-                    model=model,
-                    prompt_messages=prompt_messages,
-                    system_fingerprint=getattr(event, "item_id", ""),
-                    delta=LLMResultChunkDelta(
-                        index=index,
-                        message=AssistantPromptMessage(content=delta_text),
-                    ),
-                )
-                index += 1
-                continue
-
-            if event_type == "response.output_item.added":
-                item = getattr(event, "item", None)
-                if item and getattr(item, "type", "") == "function_call":
-                    call_id = getattr(item, "call_id", "")
-                    function_name = getattr(item, "name", "")
-                    if call_id:
-                        pending_tool_calls[call_id] = {
-                            "name": function_name,
-                            "arguments": "",
-                        }
-                        current_tool_call = call_id
+            # Pydantic models keep their fields in __dict__; one C-level dict
+            # read per field beats repeated getattr-with-default in this loop.
+            event_data = event.__dict__
+            handler = handlers.get(event_data.get("type", ""))
+            if handler is None:
                 continue
+            chunks = handler(self, event_data, state)
+            if chunks is not None:
+                yield from chunks
 
-            if event_type == "response.function_call_arguments.delta":
-                delta_args = getattr(event, "delta", "")
-                call_id = getattr(event, "item_id", "") or current_tool_call
-                if delta_args and call_id and call_id in pending_tool_calls:
-                    pending_tool_calls[call_id]["arguments"] += delta_args
-                continue
-
-            if event_type == "response.function_call_arguments.done":
-                call_id = getattr(event, "item_id", "") or current_tool_call
-                final_args = getattr(event, "arguments", "")
-                if call_id and call_id in pending_tool_calls and isinstance(final_args, str):
-                    pending_tool_calls[call_id]["arguments"] = final_args
-                continue
-
-            if event_type == "response.output_item.done":
-                item = getattr(event, "item", None)
-                if not item or getattr(item, "type", "") != "function_call":
-                    continue
-
-                call_id = getattr(item, "call_id", "")
-                function_name = getattr(item, "name", "")
-                fallback_arguments = getattr(item, "arguments", "") or "{}"
-
-                arguments = fallback_arguments
-                if call_id and call_id in pending_tool_calls:
-                    arguments = pending_tool_calls[call_id].get("arguments") or fallback_arguments
-
-                if function_name:
-                    tool_call = self._build_tool_call(
-                        function_name=function_name,
-                        call_id=call_id,
-                        arguments=arguments,
-                    )
-                    tool_calls.append(tool_call)
-
-                    yield LLMResultChunk(
-                        model=model,
-                        prompt_messages=prompt_messages,
-                        system_fingerprint=call_id,
-                        delta=LLMResultChunkDelta(
-                            index=index,
-                            message=AssistantPromptMessage(content="", tool_calls=[tool_call]),
-                        ),
-                    )
-                    index += 1
-
-                if call_id in pending_tool_calls:
-                    del pending_tool_calls[call_id]
-                if call_id == current_tool_call:
-                    current_tool_call = None
-                continue
-
-            if event_type == "response.completed":
-                final_response = getattr(event, "response", None)
+        if state.pending_delta:
+            yield self._flush_stream_text(state)
 
+        full_text = "".join(state.text_parts)
         usage = self._build_usage(
             model=model,
             credentials=credentials,
-            response=final_response,
+            response=state.final_response,
             prompt_messages=prompt_messages,
-            assistant_prompt_message=AssistantPromptMessage(content=full_text, tool_calls=tool_calls),
+            assistant_prompt_message=AssistantPromptMessage(
+                content=full_text, tool_calls=state.tool_calls
+            ),
             tools=tools,
         )
 
-        finish_reason = "tool_calls" if tool_calls and not full_text.strip() else "stop"
+        finish_reason = "tool_calls" if state.tool_calls and not full_text.strip() else "stop"
         yield LLMResultChunk(
             model=model,
             prompt_messages=prompt_messages,
-            system_fingerprint=getattr(final_response, "id", ""),
+            system_fingerprint=getattr(state.final_response, "id", ""),
             delta=LLMResultChunkDelta(
-                index=index,
+                index=state.index,
                 message=AssistantPromptMessage(content=""),
                 finish_reason=finish_reason,
                 usage=usage,
             ),
         )
 
+    def _flush_stream_text(self, state: _StreamState) -> LLMResultChunk:
+        # model_construct skips Pydantic validation; every field here is
+        # internal, already-validated data, and validation dominates the cost
+        # of building three models per emitted chunk.
+        chunk = LLMResultChunk.model_construct(
+            model=state.model,
+            prompt_messages=state.prompt_messages,
+            system_fingerprint=state.pending_item_id,
+            delta=LLMResultChunkDelta.model_construct(
+                index=state.index,
+                message=AssistantPromptMessage.model_construct(
+                    content=state.pending_delta, tool_calls=[]
+                ),
+            ),
+        )
+
+        state.index += 1
+        state.pending_delta = ""
+        state.last_flush_ns = time.monotonic_ns()
+        return chunk
+
+    def _on_stream_text_delta(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> Generator[LLMResultChunk, None, None]:
+        delta_text = event_data.get("delta", "")
+        if not delta_text:
+            return
+
+        state.text_parts.append(delta_text)
+        state.pending_delta += delta_text
+        state.pending_item_id = event_data.get("item_id", "")
+
+        if (
+            len(state.pending_delta) >= self._STREAM_FLUSH_MIN_CHARS
+            or time.monotonic_ns() - state.last_flush_ns >= self._STREAM_FLUSH_INTERVAL_NS
+        ):
+            yield self._flush_stream_text(state)
+
+    def _on_stream_output_item_added(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> None:
+        item = event_data.get("item")
+        if item and getattr(item, "type", "") == "function_call":
+            call_id = getattr(item, "call_id", "")
+            function_name = getattr(item, "name", "")
+            if call_id:
+                state.pending_tool_calls[call_id] = {
+                    "name": function_name,
+                    "arguments_parts": [],
+                }
+                state.current_tool_call = call_id
+
+    def _on_stream_function_call_arguments_delta(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> None:
+        delta_args = event_data.get("delta", "")
+        call_id = event_data.get("item_id", "") or state.current_tool_call
+        if delta_args and call_id and call_id in state.pending_tool_calls:
+            state.pending_tool_calls[call_id]["arguments_parts"].append(delta_args)
+
+    def _on_stream_function_call_arguments_done(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> None:
+        call_id = event_data.get("item_id", "") or state.current_tool_call
+        final_args = event_data.get("arguments", "")
+        if call_id and call_id in state.pending_tool_calls and isinstance(final_args, str):
+            state.pending_tool_calls[call_id]["arguments_parts"] = [final_args]
+
+    def _on_stream_output_item_done(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> Generator[LLMResultChunk, None, None]:
+        item = event_data.get("item")
+        if not item or getattr(item, "type", "") != "function_call":
+            return
+
+        call_id = getattr(item, "call_id", "")
+        function_name = getattr(item, "name", "")
+        fallback_arguments = getattr(item, "arguments", "") or "{}"
+
+        arguments = fallback_arguments
+        if call_id and call_id in state.pending_tool_calls:
+            arguments = (
+                "".join(state.pending_tool_calls[call_id].get("arguments_parts") or ())
+                or fallback_arguments
+            )
+
+        if function_name:
+            if state.pending_delta:
+                yield self._flush_stream_text(state)
+
+            tool_call = self._build_tool_call(
+                function_name=function_name,
+                call_id=call_id,
+                arguments=arguments,
+            )
+            state.tool_calls.append(tool_call)
+
+            yield LLMResultChunk(
+                model=state.model,
+                prompt_messages=state.prompt_messages,
+                system_fingerprint=call_id,
+                delta=LLMResultChunkDelta(
+                    index=state.index,
+                    message=AssistantPromptMessage(content="", tool_calls=[tool_call]),
+                ),
+            )
+            state.index += 1
+
+        if call_id in state.pending_tool_calls:
+            del state.pending_tool_calls[call_id]
+        if call_id == state.current_tool_call:
+            state.current_tool_call = None
+
+    def _on_stream_completed(
+        self, event_data: dict[str, Any], state: _StreamState
+    ) -> None:
+        state.final_response = event_data.get("response")
+
+    # One dict lookup per event instead of an if/elif chain over every type.
+    _STREAM_HANDLERS = {
+        "response.output_text.delta": _on_stream_text_delta,
+        "response.output_item.added": _on_stream_output_item_added,
+        "response.function_call_arguments.delta": _on_stream_function_call_arguments_delta,
+        "response.function_call_arguments.done": _on_stream_function_call_arguments_done,
+        "response.output_item.done": _on_stream_output_item_done,
+        "response.completed": _on_stream_completed,
+    }
+
     def _build_usage(
         self,
         *,
@@ -551,30 +774,28 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         assistant_prompt_message: AssistantPromptMessage,
         tools: Optional[list[PromptMessageTool]],
     ):
-        prompt_tokens = 0
-        completion_tokens = 0
-
         response_usage = getattr(response, "usage", None)
-        if response_usage:
-            prompt_tokens = (
-                getattr(response_usage, "input_tokens", None)
-                or getattr(response_usage, "prompt_tokens", None)
-                or 0
-            )
-            completion_tokens = (
-                getattr(response_usage, "output_tokens", None)
-                or getattr(response_usage, "completion_tokens", None)
-                or 0
+        if response_usage is not None:
+            # Trust the gateway's usage as-is: re-tokenizing the whole prompt
+            # just because a field came back zero is far more expensive than
+            # the rare zero-token edge case is worth.
+            return self._calc_response_usage(
+                model=model,
+                credentials=credentials,
+                prompt_tokens=(
+                    getattr(response_usage, "input_tokens", None)
+                    or getattr(response_usage, "prompt_tokens", None)
+                    or 0
+                ),
+                completion_tokens=(
+                    getattr(response_usage, "output_tokens", None)
+                    or getattr(response_usage, "completion_tokens", None)
+                    or 0
+                ),
             )
 
-        if not prompt_tokens:
-            prompt_tokens = self.get_num_tokens(model, credentials, prompt_messages, tools)
-        if not completion_tokens:
-            completion_tokens = self.get_num_tokens(
-                model,
-                credentials,
-                [assistant_prompt_message],
-            )
+        prompt_tokens = self.get_num_tokens(model, credentials, prompt_messages, tools)
+        completion_tokens = self.get_num_tokens(model, credentials, [assistant_prompt_message])
 
         return self._calc_response_usage(
             model=model,
@@ -588,24 +809,22 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         if not output:
             return ""
 
-        chunks: list[str] = []
+        # Single pass fused straight into join: no intermediate chunks list.
+        return "".join(self._iter_output_texts(output))
+
+    def _iter_output_texts(self, output: Any) -> Generator[str, None, None]:
         for item in output:
             item_type = getattr(item, "type", "")
             if item_type == "message":
-                for content in getattr(item, "content", []) or []:
-                    content_type = getattr(content, "type", "")
-                    if content_type in ("output_text", "text", "input_text"):
+                for content in getattr(item, "content", None) or ():
+                    if getattr(content, "type", "") in _TEXT_CONTENT_TYPES:
                         text_value = getattr(content, "text", "")
                         if text_value:
-                            chunks.append(text_value)
-                continue
-
-            if item_type in ("output_text", "text"):
+                            yield text_value
+            elif item_type in ("output_text", "text"):
                 text_value = getattr(item, "text", "")
                 if text_value:
-                    chunks.append(text_value)
-
-        return "".join(chunks)
+                    yield text_value
 
     def _extract_response_tool_calls(
         self,
@@ -627,7 +846,7 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
 
             arguments = getattr(item, "arguments", "{}")
             if isinstance(arguments, dict):
-                arguments = json.dumps(arguments)
+                arguments = _dumps(arguments)
             elif not isinstance(arguments, str):
                 arguments = "{}"
 
@@ -680,7 +899,7 @@ class CodexResponsesLargeLanguageModel(_CommonOpenAI, LargeLanguageModel):
         try:
             return fn()
         except Exception as ex:
-            for mapped_error, openai_errors in self._invoke_error_mapping.items():
-                if isinstance(ex, tuple(openai_errors)):
+            for mapped_error, openai_errors in self._ERROR_TABLE:
+                if isinstance(ex, openai_errors):
                     raise mapped_error(str(ex))
             raise InvokeError(str(ex))
@@ -10,58 +10,254 @@ paste them into Dify's "customizable model" field.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import sys
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
 
+# Heavy modules (urllib.request pulls in ssl/email/http.client; httpx and
+# asyncio are heavier still) are imported lazily inside the functions that
+# need them, so `--help` doesn't pay their interpreter-startup cost.
 
-def _join(base: str, path: str) -> str:
-    base = (base or "").strip()
-    if not base:
-        raise ValueError("api_base is required")
-    return urllib.parse.urljoin(base.rstrip("/") + "/", path.lstrip("/"))
+_UNRESOLVED = object()
+_httpx = _UNRESOLVED
+_orjson = _UNRESOLVED
 
 
-def _http_json(method: str, url: str, *, api_key: str, payload: dict | None = None, timeout: int = 30) -> dict:
-    headers = {
+def _get_httpx():
+    """Optional: enables pooled/concurrent probes; urllib otherwise."""
+    global _httpx
+    if _httpx is _UNRESOLVED:
+        try:
+            import httpx
+        except ImportError:
+            httpx = None
+        _httpx = httpx
+    return _httpx
+
+
+def _get_orjson():
+    """Optional: faster JSON codec; stdlib json otherwise."""
+    global _orjson
+    if _orjson is _UNRESOLVED:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _print_json(obj) -> None:
+    orjson = _get_orjson()
+    if orjson is not None:
+        # orjson emits UTF-8 bytes; writing them to the buffer directly skips
+        # the stdout text-layer encoding pass.
+        sys.stdout.buffer.write(orjson.dumps(obj))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        json.dump(obj, sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+
+@dataclass(slots=True)
+class ProbeCtx:
+    """Resolved connection config shared by every call in one CLI run."""
+
+    api_base: str
+    api_key: str
+    timeout: int
+
+
+# Cached /models catalogs, one file per api_base (stale-while-revalidate:
+# served within TTL, refetched past it, stale copy used if the refetch fails).
+_CACHE_DIR = Path("~/.wuwu/remote_models_cache").expanduser()
+
+_CLIENT = None
+
+
+def _get_client():
+    """Shared pooled httpx client so sequential calls reuse one TCP/TLS connection."""
+    global _CLIENT
+    if _CLIENT is None:
+        httpx = _get_httpx()
+        _CLIENT = httpx.Client(
+            # Limits must ride on the transport: httpx ignores client-level
+            # limits= once an explicit transport= is supplied.
+            transport=httpx.HTTPTransport(
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=16, max_connections=16, keepalive_expiry=30
+                ),
+            ),
+            # urllib followed redirects; keep parity for gateways behind a 301.
+            follow_redirects=True,
+        )
+    return _CLIENT
+
+
+def _headers(api_key: str) -> dict[str, str]:
+    return {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
         "Accept": "application/json",
         "User-Agent": "wuwu-logistics-dify-plugin-remote-models/0.1",
     }
+
+
+@functools.lru_cache(maxsize=32)
+def _join(base: str, path: str) -> str:
+    # Pure function over short strings; caching skips the urljoin re-parse on
+    # the repeated (api_base, path) pairs a probe-tiers run produces.
+    from urllib.parse import urljoin
+
+    base = (base or "").strip()
+    if not base:
+        raise ValueError("api_base is required")
+    return urljoin(base.rstrip("/") + "/", path.lstrip("/"))
+
+
+def _http_json(method: str, url: str, *, api_key: str, payload: dict | None = None, timeout: int = 30) -> dict:
+    import io
+    import urllib.error
+    import urllib.request
+
+    headers = _headers(api_key)
     data = None
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
+        data = _json_dumps_bytes(payload)
+
+    httpx = _get_httpx()
+    if httpx is not None:
+        try:
+            with _get_client().stream(
+                method.upper(), url, content=data, headers=headers, timeout=timeout
+            ) as resp:
+                if resp.status_code >= 400:
+                    # Surface failures as HTTPError so callers keep one except
+                    # path regardless of which transport served the request.
+                    raise urllib.error.HTTPError(
+                        url, resp.status_code, resp.reason_phrase, resp.headers, io.BytesIO(resp.read())
+                    )
+                return _parse_response_lines(resp.iter_lines(), url)
+        except httpx.TransportError as e:
+            # Same contract for network failures: callers catch URLError, not
+            # httpx.ConnectError/TimeoutException (neither is an OSError).
+            raise urllib.error.URLError(e) from e
+
     req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
     with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
-    text = raw.decode("utf-8", errors="replace")
-    try:
-        return json.loads(text)
-    except Exception:
-        # Some OpenAI-compatible gateways may return SSE even when stream=false.
-        if "event:" in text and "\ndata:" in text:
-            for line in text.splitlines():
-                line = line.strip()
-                if not line.startswith("data:"):
-                    continue
-                data = line[len("data:") :].strip()
-                if not data or data == "[DONE]":
-                    continue
+        return _parse_response_lines(resp, url)
+
+
+def _parse_response_lines(lines, url: str) -> dict:
+    # Scan line-by-line so an SSE body (some OpenAI-compatible gateways return
+    # SSE even when stream=false) short-circuits on its first data: line
+    # without buffering the rest of the stream. Plain JSON bodies are
+    # accumulated and parsed once at end of stream; dropping the newlines
+    # between lines is safe since JSON strings cannot contain raw newlines.
+    body_parts: list[str] = []
+    for raw_line in lines:
+        line = (
+            raw_line.decode("utf-8", errors="replace")
+            if isinstance(raw_line, (bytes, bytearray))
+            else raw_line
+        )
+        stripped = line.strip()
+        if stripped.startswith("data:"):
+            payload = stripped[len("data:") :].strip()
+            if payload and payload != "[DONE]":
                 try:
-                    return json.loads(data)
-                except Exception:
-                    continue
-        raise RuntimeError(f"Non-JSON response from {url}: {raw[:200]!r}")
+                    return _json_loads(payload)
+                except ValueError:
+                    pass
+            continue
+        body_parts.append(line)
+
+    text = "".join(body_parts)
+    try:
+        return _json_loads(text)
+    except ValueError:
+        raise RuntimeError(f"Non-JSON response from {url}: {text[:200]!r}")
+
 
+def _cache_path(api_base: str) -> Path:
+    return _CACHE_DIR / f"{hashlib.sha1(api_base.encode('utf-8')).hexdigest()}.json"
 
-def list_models(api_base: str, api_key: str, timeout: int) -> list[str]:
-    url = _join(api_base, "/models")
+
+def _read_cache(path: Path, max_age: float | None = None) -> list[str] | None:
     try:
-        data = _http_json("GET", url, api_key=api_key, timeout=timeout)
+        if max_age is not None and time.time() - path.stat().st_mtime >= max_age:
+            return None
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, list) else None
+
+
+def _write_cache(path: Path, model_ids: list[str]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(model_ids))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Caching is best-effort; never fail the listing over it.
+
+
+def list_models(
+    ctx: ProbeCtx,
+    *,
+    cache_ttl: int = 3600,
+    no_cache: bool = False,
+) -> list[str]:
+    import urllib.error
+
+    cache_path = _cache_path(ctx.api_base)
+    if not no_cache:
+        cached = _read_cache(cache_path, max_age=cache_ttl)
+        if cached is not None:
+            return cached
+
+    try:
+        model_ids = _fetch_models(ctx)
+    except (urllib.error.HTTPError, urllib.error.URLError, OSError):
+        if not no_cache:
+            # Network failure: serve the stale catalog if we have one.
+            cached = _read_cache(cache_path)
+            if cached is not None:
+                return cached
+        raise
+
+    if not no_cache:
+        _write_cache(cache_path, model_ids)
+    return model_ids
+
+
+def _fetch_models(ctx: ProbeCtx) -> list[str]:
+    import urllib.error
+
+    url = _join(ctx.api_base, "/models")
+    try:
+        data = _http_json("GET", url, api_key=ctx.api_key, timeout=ctx.timeout)
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise RuntimeError(
@@ -69,25 +265,29 @@ def list_models(api_base: str, api_key: str, timeout: int) -> list[str]:
             ) from e
         raise
 
-    items = data.get("data")
-    if isinstance(items, list):
-        model_ids = []
-        for item in items:
-            if isinstance(item, dict) and isinstance(item.get("id"), str):
-                model_ids.append(item["id"])
-        return model_ids
-
-    # Some gateways may return {"models": [...]} or plain list.
+    # Normalize the three payload shapes ({"data": [...]}, {"models": [...]},
+    # plain list) once, then extract ids in a single walk. Presence is checked
+    # explicitly: an empty catalog ({"data": []}) is valid, not missing.
     if isinstance(data, list):
-        return [m.get("id") for m in data if isinstance(m, dict) and isinstance(m.get("id"), str)]
-    if isinstance(data.get("models"), list):
-        return [m.get("id") for m in data["models"] if isinstance(m, dict) and isinstance(m.get("id"), str)]
+        items = data
+    elif isinstance(data.get("data"), list):
+        items = data["data"]
+    elif isinstance(data.get("models"), list):
+        items = data["models"]
+    else:
+        raise RuntimeError(f"Unrecognized /models payload shape: keys={sorted(data.keys())}")
 
-    raise RuntimeError(f"Unrecognized /models payload shape: keys={sorted(data.keys())}")
+    return [
+        mid
+        for item in items
+        if isinstance(item, dict) and type(mid := item.get("id")) is str
+    ]
 
 
-def probe_model(api_base: str, api_key: str, model: str, timeout: int) -> tuple[bool, str]:
-    url = _join(api_base, "/responses")
+def probe_model(ctx: ProbeCtx, model: str) -> tuple[bool, str]:
+    import urllib.error
+
+    url = _join(ctx.api_base, "/responses")
     payload = {
         "model": model,
         "input": "ping",
@@ -95,7 +295,7 @@ def probe_model(api_base: str, api_key: str, model: str, timeout: int) -> tuple[
         "stream": False,
     }
     try:
-        _http_json("POST", url, api_key=api_key, payload=payload, timeout=timeout)
+        _http_json("POST", url, api_key=ctx.api_key, payload=payload, timeout=ctx.timeout)
         return True, "ok"
     except urllib.error.HTTPError as e:
         body = ""
@@ -108,7 +308,223 @@ def probe_model(api_base: str, api_key: str, model: str, timeout: int) -> tuple[
         return False, str(e)
 
 
-def _parse_args(argv: list[str]) -> argparse.Namespace:
+async def _probe_model_async(client, url: str, headers: dict[str, str], model: str) -> tuple[bool, str]:
+    payload = {
+        "model": model,
+        "input": "ping",
+        "max_output_tokens": 16,
+        "stream": False,
+    }
+    try:
+        resp = await client.post(url, json=payload, headers=headers)
+        if resp.status_code >= 400:
+            return False, f"http {resp.status_code}: {resp.text[:300]}".strip()
+        return True, "ok"
+    except Exception as e:
+        return False, str(e)
+
+
+async def _probe_tiers_async(
+    ctx: ProbeCtx, candidates: list[str], first_ok: bool = False
+) -> tuple[list[dict], bool]:
+    import asyncio
+
+    httpx = _get_httpx()
+    # One shared AsyncClient so DNS resolution and TCP/TLS handshakes are
+    # amortized across tiers (later connections resume the TLS 1.3 session);
+    # the probes themselves are independent POSTs and run concurrently. With
+    # HTTP/2 (needs the h2 package; ALPN falls back to HTTP/1.1 when the
+    # gateway refuses it) every probe multiplexes over one connection.
+    from importlib.util import find_spec
+
+    # http2= and limits= must be set on the transport: httpx ignores the
+    # client-level kwargs when an explicit transport= is supplied. Unlike the
+    # client-level flag, the transport constructor doesn't verify h2 is
+    # importable — without the explicit gate ALPN still offers h2 and the lazy
+    # import fails mid-request. HTTP/1.1 still probes concurrently over the
+    # pool when h2 is absent.
+    transport = httpx.AsyncHTTPTransport(
+        retries=1,
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+    )
+    client = httpx.AsyncClient(transport=transport, timeout=ctx.timeout, follow_redirects=True)
+    # Normalize once, outside the per-candidate tasks: every probe shares the
+    # same URL and header dict instead of re-deriving them.
+    url = _join(ctx.api_base, "/responses")
+    headers = _headers(ctx.api_key)
+
+    async with client:
+
+        async def _timed(candidate: str) -> dict:
+            started = time.monotonic_ns()
+            ok, detail = await _probe_model_async(client, url, headers, candidate)
+            return {
+                "model": candidate,
+                "ok": ok,
+                "detail": detail,
+                "elapsed_ms": (time.monotonic_ns() - started) // 1_000_000,
+            }
+
+        tasks = [asyncio.ensure_future(_timed(c)) for c in candidates]
+        if not first_ok:
+            return list(await asyncio.gather(*tasks)), False
+
+        results: list[dict] = []
+        stopped_early = False
+        for fut in asyncio.as_completed(tasks):
+            result = await fut
+            results.append(result)
+            if result["ok"]:
+                stopped_early = True
+                for task in tasks:
+                    task.cancel()
+                break
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return results, stopped_early
+
+
+def _endpoint_exists(ctx: ProbeCtx, path: str) -> bool:
+    # HEAD probe; only a definitive 404 counts as absent (405 and friends mean
+    # the route exists but rejects HEAD). Network errors report absent so the
+    # caller falls back to the per-candidate path, which has its own reporting.
+    import urllib.error
+    import urllib.request
+
+    url = _join(ctx.api_base, path)
+    try:
+        if _get_httpx() is not None:
+            resp = _get_client().head(url, headers=_headers(ctx.api_key), timeout=ctx.timeout)
+            return resp.status_code != 404
+        req = urllib.request.Request(url, headers=_headers(ctx.api_key), method="HEAD")
+        with urllib.request.urlopen(req, timeout=ctx.timeout):
+            return True
+    except urllib.error.HTTPError as e:
+        return e.code != 404
+    except Exception:
+        return False
+
+
+def _probe_tiers_batched(ctx: ProbeCtx, candidates: list[str]) -> list[dict] | None:
+    """Probe every candidate in one /batches round-trip, for gateways that offer it.
+
+    Returns None when the gateway has no usable batch endpoint (or answers in a
+    shape we don't recognize), in which case the caller runs the concurrent
+    per-candidate probes instead. One POST replaces N handshakes, so wall time
+    becomes one RTT plus server-side fan-out.
+    """
+    import urllib.error
+
+    if not _endpoint_exists(ctx, "/batches"):
+        return None
+
+    url = _join(ctx.api_base, "/batches")
+    payload = {
+        "requests": [
+            {"model": candidate, "input": "ping", "max_output_tokens": 16}
+            for candidate in candidates
+        ]
+    }
+    started = time.monotonic_ns()
+    try:
+        data = _http_json("POST", url, api_key=ctx.api_key, payload=payload, timeout=ctx.timeout)
+    except urllib.error.HTTPError:
+        # Endpoint exists but rejected the inline-array form (e.g. the official
+        # file-based Batch API); the per-candidate loop still works.
+        return None
+    except Exception:
+        return None
+    elapsed_ms = (time.monotonic_ns() - started) // 1_000_000
+
+    entries = data.get("results") or data.get("data") or data.get("responses")
+    if not isinstance(entries, list) or len(entries) != len(candidates):
+        return None
+
+    results: list[dict] = []
+    for candidate, entry in zip(candidates, entries):
+        if not isinstance(entry, dict):
+            return None
+        error = entry.get("error")
+        status = entry.get("status")
+        ok = error is None and status in (None, "ok", "succeeded", "completed")
+        if ok:
+            detail = "ok"
+        elif isinstance(error, dict):
+            detail = str(error.get("message") or error)
+        elif error is not None:
+            detail = str(error)
+        else:
+            detail = f"status {status}"
+        results.append(
+            {
+                "model": entry.get("model") or candidate,
+                "ok": ok,
+                "detail": detail,
+                # Server-side fan-out: one shared round-trip, so each entry
+                # carries the batch's total wall time.
+                "elapsed_ms": elapsed_ms,
+            }
+        )
+    return results
+
+
+def _probe_tier_timed(ctx: ProbeCtx, candidate: str) -> dict:
+    # monotonic_ns: immune to NTP wall-clock adjustments and integer-only.
+    started = time.monotonic_ns()
+    ok, detail = probe_model(ctx, candidate)
+    return {
+        "model": candidate,
+        "ok": ok,
+        "detail": detail,
+        "elapsed_ms": (time.monotonic_ns() - started) // 1_000_000,
+    }
+
+
+def _probe_tiers_threaded(
+    ctx: ProbeCtx, candidates: list[str], first_ok: bool = False
+) -> tuple[list[dict], bool]:
+    # urlopen releases the GIL during I/O, so a small thread pool gives
+    # near-linear speedup over the serial loop with no extra dependencies.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if not candidates:
+        # ThreadPoolExecutor rejects max_workers=0; --tiers with no values is
+        # simply an empty result set.
+        return [], False
+
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+        if not first_ok:
+            return (
+                list(
+                    pool.map(
+                        lambda candidate: _probe_tier_timed(ctx, candidate),
+                        candidates,
+                    )
+                ),
+                False,
+            )
+
+        futs = {
+            pool.submit(_probe_tier_timed, ctx, candidate): candidate
+            for candidate in candidates
+        }
+        results: list[dict] = []
+        stopped_early = False
+        for fut in as_completed(futs):
+            result = fut.result()
+            results.append(result)
+            if result["ok"]:
+                stopped_early = True
+                for other in futs:
+                    other.cancel()
+                break
+        return results, stopped_early
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Built once: callers that drive main() repeatedly (tests, scripted loops)
+    # shouldn't re-register every argparse action per invocation.
     p = argparse.ArgumentParser()
     p.add_argument("--api-base", required=True, help="API base URL, e.g. https://your-host/v1")
     p.add_argument("--api-key", default="", help="API key (Bearer token). If omitted, read from env.")
@@ -118,6 +534,13 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         help="Env var name to read API key from when --api-key is omitted (default: CODEX_API_KEY)",
     )
     p.add_argument("--timeout", type=int, default=30, help="HTTP timeout seconds (default: 30)")
+    p.add_argument("--no-cache", action="store_true", help="Bypass the on-disk /models cache")
+    p.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=3600,
+        help="Max age in seconds before the cached /models catalog is refetched (default: 3600)",
+    )
 
     sub = p.add_subparsers(dest="cmd", required=True)
 
@@ -129,6 +552,11 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
 
     p_tiers = sub.add_parser("probe-tiers", help="Probe tier suffixes for a base model")
     p_tiers.add_argument("--base-model", required=True, help="Base model id without tier suffix")
+    p_tiers.add_argument(
+        "--first-ok",
+        action="store_true",
+        help="Stop probing as soon as one tier succeeds (remaining probes are cancelled)",
+    )
     p_tiers.add_argument(
         "--tiers",
         nargs="*",
@@ -136,17 +564,26 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         help="Tier suffix candidates (default: xhigh extra-high extra_high exhigh)",
     )
 
-    return p.parse_args(argv)
+    return p
 
 
-def main(argv: list[str]) -> int:
-    args = _parse_args(argv)
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
+
+
+def _resolve_api_key(args: argparse.Namespace) -> str:
     api_key = (args.api_key or "").strip()
     if not api_key:
-        api_key = (getattr(__import__("os"), "environ").get(args.api_key_env, "") or "").strip()
+        api_key = (os.environ.get(args.api_key_env, "") or "").strip()
     if not api_key:
         # Common fallback for OpenAI-compatible gateways.
-        api_key = (getattr(__import__("os"), "environ").get("OPENAI_API_KEY", "") or "").strip()
+        api_key = (os.environ.get("OPENAI_API_KEY", "") or "").strip()
+    return api_key
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    api_key = _resolve_api_key(args)
     if not api_key:
         print(
             f"ERROR: API key not provided. Pass --api-key or set ${args.api_key_env} (or $OPENAI_API_KEY).",
@@ -154,39 +591,54 @@ def main(argv: list[str]) -> int:
         )
         return 2
 
+    ctx = ProbeCtx(api_base=args.api_base, api_key=api_key, timeout=args.timeout)
+
     if args.cmd == "list":
         try:
-            ids = list_models(args.api_base, api_key, args.timeout)
+            ids = list_models(ctx, cache_ttl=args.cache_ttl, no_cache=args.no_cache)
         except Exception as e:
             print(f"ERROR: {e}", file=sys.stderr)
             return 2
 
         filt = (args.contains or "").strip()
-        for mid in ids:
-            if not filt or filt in mid:
-                print(mid)
+        out = ids if not filt else [mid for mid in ids if filt in mid]
+        if out:
+            # One write instead of a syscall per id.
+            sys.stdout.write("\n".join(out))
+            sys.stdout.write("\n")
         return 0
 
     if args.cmd == "probe":
-        ok, detail = probe_model(args.api_base, api_key, args.model, args.timeout)
-        print(json.dumps({"model": args.model, "ok": ok, "detail": detail}, ensure_ascii=False))
+        ok, detail = probe_model(ctx, args.model)
+        _print_json({"model": args.model, "ok": ok, "detail": detail})
         return 0 if ok else 1
 
     if args.cmd == "probe-tiers":
-        results = []
-        for tier in args.tiers:
-            candidate = f"{args.base_model}-{tier}".rstrip("-")
-            started = time.time()
-            ok, detail = probe_model(args.api_base, api_key, candidate, args.timeout)
-            results.append(
-                {
-                    "model": candidate,
-                    "ok": ok,
-                    "detail": detail,
-                    "elapsed_ms": int((time.time() - started) * 1000),
-                }
-            )
-        print(json.dumps({"base_model": args.base_model, "results": results}, ensure_ascii=False))
+        candidates = [f"{args.base_model}-{tier}".rstrip("-") for tier in args.tiers]
+        results = None
+        stopped_early = False
+        if not args.first_ok:
+            # --first-ok wants the earliest success streamed back; batching
+            # can't cancel server-side, so it only serves the full-fan-out case.
+            results = _probe_tiers_batched(ctx, candidates)
+        if results is None:
+            if _get_httpx() is not None:
+                import asyncio
+
+                results, stopped_early = asyncio.run(
+                    _probe_tiers_async(ctx, candidates, first_ok=args.first_ok)
+                )
+            else:
+                results, stopped_early = _probe_tiers_threaded(
+                    ctx, candidates, first_ok=args.first_ok
+                )
+        _print_json(
+            {
+                "base_model": args.base_model,
+                "results": results,
+                "stopped_early": stopped_early,
+            }
+        )
         return 0 if any(r["ok"] for r in results) else 1
 
     raise RuntimeError(f"unknown cmd: {args.cmd}")